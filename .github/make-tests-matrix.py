@@ -1,5 +1,17 @@
+import json
+import os
 import re
-from urllib import request
+import time
+from urllib import error, request
+
+DAILY_BUILDS_URL = "https://builder.blender.org/download/daily/"
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".builder_cache", "daily.json")
+CACHE_TTL = 600  # seconds
+FETCH_ATTEMPTS = 3
+FETCH_BACKOFF = 0.3  # seconds
+DAILY_BUILD_RE = re.compile(
+    r"(?P<url>https://builder\.blender\.org/download/daily/blender-(?P<version>(?P<version_x_y>[34]\.\d)\.\d-\w+)\+\S{1,6}\.(?P<sha>\S{12})-linux\.x86_64-release\.tar\.xz)"
+)
 
 
 jobs = [
@@ -19,24 +31,63 @@ jobs = [
 ]
 
 
+def load_cached_page():
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def store_cached_page(page: str, etag):
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    tmp_path = CACHE_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"time": time.time(), "etag": etag, "page": page}, f)
+    os.replace(tmp_path, CACHE_PATH)
+
+
+def fetch_daily_page() -> str:
+    """Return the daily builds page, reusing a recent or unchanged cached copy."""
+    cached = load_cached_page()
+    if cached and time.time() - cached["time"] < CACHE_TTL:
+        return cached["page"]
+
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    for attempt in range(FETCH_ATTEMPTS):
+        try:
+            with request.urlopen(request.Request(DAILY_BUILDS_URL, headers=headers)) as resp:
+                page = resp.read().decode("utf-8")
+                store_cached_page(page, resp.headers.get("ETag"))
+                return page
+        except error.HTTPError as e:
+            if e.code == 304 and cached:
+                store_cached_page(cached["page"], cached.get("etag"))
+                return cached["page"]
+            if attempt == FETCH_ATTEMPTS - 1:
+                raise
+        except error.URLError:
+            if attempt == FETCH_ATTEMPTS - 1:
+                raise
+        time.sleep(FETCH_BACKOFF * (attempt + 1))
+
+
 def get_daily_builds(jobs: list):
-    resp = request.urlopen("https://builder.blender.org/download/daily/")
-    page = resp.read().decode("utf-8")
-    releases = re.findall(
-        r"(https://builder.blender.org/download/daily/blender-(((?:3|4)\.\d)\.\d-\w+)\+\S{1,6}\.(\S{12})-linux\.x86_64-release\.tar\.xz)",
-        page,
-    )
-    for release in releases:
+    page = fetch_daily_page()
+    existing_versions = {job["version"] for job in jobs}
+    for release in DAILY_BUILD_RE.finditer(page):
         new_job = {
-            "version": release[1],
-            "version_x_y": release[2],
-            "download_url": release[0],
-            "sha": release[3],
+            "version": release["version"],
+            "version_x_y": release["version_x_y"],
+            "download_url": release["url"],
+            "sha": release["sha"],
         }
-        if new_job["version"].removesuffix("-stable") not in [
-            job["version"] for job in jobs
-        ]:
+        if new_job["version"].removesuffix("-stable") not in existing_versions:
             jobs.append(new_job)
+            existing_versions.add(new_job["version"])
 
 
 get_daily_builds(jobs)
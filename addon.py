@@ -3,12 +3,40 @@ import subprocess
 import sys
 import shutil
 
+BLENDER_PATH_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "polyfem_blender", "blender_path")
+
+def read_cached_blender_executable():
+    """
+    Returns the previously discovered Blender executable if it still exists.
+    """
+    try:
+        with open(BLENDER_PATH_CACHE, 'r') as f:
+            cached_path = f.read().strip()
+    except OSError:
+        return None
+    return cached_path if cached_path and os.path.exists(cached_path) else None
+
+def write_cached_blender_executable(blender_executable):
+    """
+    Remembers the discovered Blender executable for subsequent runs.
+    """
+    try:
+        os.makedirs(os.path.dirname(BLENDER_PATH_CACHE), exist_ok=True)
+        tmp_path = BLENDER_PATH_CACHE + ".tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(blender_executable)
+        os.replace(tmp_path, BLENDER_PATH_CACHE)
+    except OSError as e:
+        print(f"Could not cache the Blender executable path: {e}")
+
 def find_blender_executable():
     """
     Attempts to find the Blender executable.
     Modify this function if Blender is installed in a non-standard location.
     """
-    blender_executable = None
+    blender_executable = read_cached_blender_executable()
+    if blender_executable is not None:
+        return blender_executable
 
     # Try to find Blender in common install locations
     if sys.platform == 'win32':
@@ -47,48 +75,48 @@ def find_blender_executable():
     if not os.path.exists(blender_executable):
         raise FileNotFoundError(f"Blender executable not found at {blender_executable}")
 
+    write_cached_blender_executable(blender_executable)
     return blender_executable
 
-def validate_manifest(blender_executable, manifest_path):
-    """
-    Validates the blender_manifest.toml file using Blender's command-line tool.
-    """
-    print("Validating the manifest...")
-    command = [
-        blender_executable,
-        "--background",
-        "--python-expr",
-        f"import bpy; bpy.ops.preferences.extension_validate(filepath=r'{manifest_path}')"
-    ]
-    try:
-        result = subprocess.run(command, check=True, capture_output=True, text=True)
-        print(result.stdout)
-        print("Manifest validation successful.")
-    except subprocess.CalledProcessError as e:
-        print("Manifest validation failed.")
-        print(e.stderr)
-        sys.exit(1)
+VALIDATE_MARKER = "POLYFEM_MANIFEST_VALID"
+BUILD_MARKER = "POLYFEM_ADDON_BUILT"
 
-def build_addon(blender_executable, addon_directory):
+def validate_and_build_addon(blender_executable, manifest_path, addon_directory):
     """
-    Builds the add-on package into a .zip file using Blender's command-line tool.
+    Validates the blender_manifest.toml file and builds the add-on package into a .zip file,
+    running both of Blender's command-line tools in a single Blender session.
     """
     output_zip = os.path.join(addon_directory, 'polyfem.zip')
-    print("Building the add-on package...")
+    print("Validating the manifest and building the add-on package...")
     command = [
         blender_executable,
         "--background",
         "--python-expr",
-        f"import bpy; bpy.ops.preferences.extension_build(directory=r'{addon_directory}', filepath=r'{output_zip}')"
+        "import bpy; "
+        f"bpy.ops.preferences.extension_validate(filepath=r'{manifest_path}'); "
+        f"print('{VALIDATE_MARKER}'); "
+        f"bpy.ops.preferences.extension_build(directory=r'{addon_directory}', filepath=r'{output_zip}'); "
+        f"print('{BUILD_MARKER}')"
     ]
-    try:
-        result = subprocess.run(command, check=True, capture_output=True, text=True)
-        print(result.stdout)
-        print("Add-on package built successfully.")
-    except subprocess.CalledProcessError as e:
-        print("Add-on package build failed.")
-        print(e.stderr)
+    # Stream Blender's output as it runs instead of buffering it all, noting each completed step
+    completed_steps = set()
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1) as process:
+        for line in process.stdout:
+            sys.stdout.write(line)
+            marker = line.strip()
+            if marker in (VALIDATE_MARKER, BUILD_MARKER):
+                completed_steps.add(marker)
+        returncode = process.wait()
+
+    if VALIDATE_MARKER not in completed_steps:
+        print(f"Manifest validation failed (exit code {returncode}).")
         sys.exit(1)
+    print("Manifest validation successful.")
+
+    if BUILD_MARKER not in completed_steps or returncode != 0:
+        print(f"Add-on package build failed (exit code {returncode}).")
+        sys.exit(1)
+    print("Add-on package built successfully.")
 
 def main():
     # Get the script's directory (assuming it's in the add-on's root directory)
@@ -101,11 +129,8 @@ def main():
     # Find Blender executable
     blender_executable = find_blender_executable()
 
-    # Validate the manifest
-    validate_manifest(blender_executable, manifest_path)
-
-    # Build the add-on package
-    build_addon(blender_executable, addon_directory)
+    # Validate the manifest and build the add-on package
+    validate_and_build_addon(blender_executable, manifest_path, addon_directory)
 
 if __name__ == "__main__":
     main()
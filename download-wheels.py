@@ -20,29 +20,30 @@ if not os.path.exists(wheels_dir):
 def is_valid_package_name(name):
     return all(c.isalnum() or c in ('_', '-') for c in name)
 
+requirements = []
 for package_name, package_version in packages.items():
     if not is_valid_package_name(package_name):
         print(f"Invalid package name: {package_name}")
         continue
-
-    # Construct the pip download command securely using shlex
-    command = [
-        sys.executable, '-m', 'pip', 'download',
-        '--only-binary=:all:',
-        '--python-version=3.11',
-        '--platform=win_amd64',
-        '-d', wheels_dir,
-        shlex.quote(f"{package_name}=={package_version}")  # Safer quoting
-    ]
-
-    print(f"Downloading {package_name}=={package_version}")
-
-    try:
-        # Safely run the command
-        subprocess.run(command, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Failed to download {package_name}: {e}")
-    except Exception as e:
-        print(f"An unexpected error occurred while downloading {package_name}: {e}")
+    requirements.append(shlex.quote(f"{package_name}=={package_version}"))  # Safer quoting
+
+# A single pip process resolves and downloads every requirement, paying
+# interpreter start-up and resolver initialisation only once
+command = [
+    sys.executable, '-m', 'pip', 'download',
+    '--only-binary=:all:',
+    '--python-version=3.11',
+    '--platform=win_amd64',
+    '-d', wheels_dir,
+    *requirements
+]
+
+print(f"Downloading {', '.join(requirements)}")
+
+try:
+    subprocess.run(command, check=True)
+except subprocess.CalledProcessError as e:
+    print(f"Failed to download wheels: {e}")
+    sys.exit(1)
 
 print("Done downloading wheels.")
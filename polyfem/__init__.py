@@ -1,5 +1,8 @@
 import bpy
+import os
 import sys
+import hashlib
+import importlib.util
 import logging
 import subprocess
 import threading
@@ -47,77 +50,101 @@ def display_message(message, title="Notification", icon='INFO'):
     # Register a one-time timer to run the popup on the main thread
     bpy.app.timers.register(show_popup)
 
+def get_install_marker_path(packages, modules_path):
+    """Marker file recording that this exact package list was installed into modules_path."""
+    token = hashlib.sha256(repr((sorted(packages), modules_path)).encode()).hexdigest()[:16]
+    return os.path.join(modules_path, f".polyfem-installed-{token}")
+
 def background_install_packages(packages, modules_path):
     """Install the required Python packages in the background."""
+    marker_path = get_install_marker_path(packages, modules_path)
+    if os.path.exists(marker_path):
+        logger.info("Required packages already installed.")
+        return
+
     def install_packages():
-        bpy.context.window_manager.progress_begin(0, len(packages))
+        bpy.context.window_manager.progress_begin(0, len(packages) + 1)
+        missing_packages = []
         for i, package in enumerate(packages):
-            try:
-                __import__(package)
+            # Locate the package without executing it; importing e.g. meshio pulls in numpy and more
+            if importlib.util.find_spec(package) is not None:
                 logger.info(f"'{package}' is already installed.")
-            except ImportError:
-                logger.info(f"Installing '{package}'...")
-                try:
-                    subprocess.check_call([
-                        sys.executable,
-                        "-m",
-                        "pip",
-                        "install",
-                        "--upgrade",
-                        "--target",
-                        modules_path,
-                        package
-                    ])
-                    logger.info(f"'{package}' installed successfully.")
-                except subprocess.CalledProcessError as e:
-                    logger.error(f"Failed to install '{package}'. Error: {e}")
-                    display_message(f"Failed to install '{package}'. Check console for details.", icon='ERROR')
+            else:
+                missing_packages.append(package)
             bpy.context.window_manager.progress_update(i + 1)
+
+        if missing_packages:
+            # A single pip run resolves shared dependencies once and fetches all packages together;
+            # separate concurrent runs would race while writing the same --target directory
+            logger.info(f"Installing {', '.join(missing_packages)}...")
+            try:
+                subprocess.check_call([
+                    sys.executable,
+                    "-m",
+                    "pip",
+                    "install",
+                    "--upgrade",
+                    "--target",
+                    modules_path,
+                    *missing_packages
+                ])
+                logger.info(f"{', '.join(missing_packages)} installed successfully.")
+            except subprocess.CalledProcessError as e:
+                logger.error(f"Failed to install {', '.join(missing_packages)}. Error: {e}")
+                display_message(f"Failed to install {', '.join(missing_packages)}. Check console for details.", icon='ERROR')
+                bpy.context.window_manager.progress_end()
+                return
+        try:
+            open(marker_path, 'w').close()
+        except OSError as e:
+            logger.warning(f"Could not write install marker '{marker_path}': {e}")
+        bpy.context.window_manager.progress_update(len(packages) + 1)
         bpy.context.window_manager.progress_end()
         display_message("All required packages installed successfully.")
 
     threading.Thread(target=install_packages, daemon=True).start()
 
-# Import classes from submodules using relative imports
-from .operators.run_polyfem import RunPolyFemSimulationOperator, OpenPolyFemDocsOperator, RenderPolyFemAnimationOperator, ClearCachePolyFemOperator
-from .operators.create_polyfem_json import CreatePolyFemJSONOperator, PolyFEMApplyMaterial, POLYFEM_OT_ShowMessageBox, PullDockerImages
-from .panels.polyfem_json import PolyFEMPanel
-from .properties.physics_export_addon import PhysicsExportAddonPreferences
-from .properties.polyfem import PolyFEMSettings, PolyFEMObjectProperties
+# Classes registered by register(); filled in there so submodules are only imported when the add-on is enabled
+classes = []
+
+def load_classes():
+    """Import the add-on submodules; return all classes to register/unregister, in order, and the two PropertyGroups."""
+    from .operators.run_polyfem import RunPolyFemSimulationOperator, OpenPolyFemDocsOperator, RenderPolyFemAnimationOperator, ClearCachePolyFemOperator
+    from .operators.create_polyfem_json import CreatePolyFemJSONOperator, PolyFEMApplyMaterial, POLYFEM_OT_ShowMessageBox, PullDockerImages
+    from .panels.polyfem_json import PolyFEMPanel
+    from .properties.physics_export_addon import PhysicsExportAddonPreferences
+    from .properties.polyfem import PolyFEMSettings, PolyFEMObjectProperties
 
-# List of all classes to register/unregister
-classes = [
-    # PropertyGroups
-    PolyFEMSettings,
-    PolyFEMObjectProperties,
+    return [
+        # PropertyGroups
+        PolyFEMSettings,
+        PolyFEMObjectProperties,
 
-    # AddonPreferences
-    PhysicsExportAddonPreferences,
+        # AddonPreferences
+        PhysicsExportAddonPreferences,
 
-    # Panels
-    PolyFEMPanel,
+        # Panels
+        PolyFEMPanel,
 
-    # Operators
-    RunPolyFemSimulationOperator,
-    RenderPolyFemAnimationOperator,
-    OpenPolyFemDocsOperator,
-    ClearCachePolyFemOperator,
-    CreatePolyFemJSONOperator,
-    PolyFEMApplyMaterial,
+        # Operators
+        RunPolyFemSimulationOperator,
+        RenderPolyFemAnimationOperator,
+        OpenPolyFemDocsOperator,
+        ClearCachePolyFemOperator,
+        CreatePolyFemJSONOperator,
+        PolyFEMApplyMaterial,
 
-    # ShowMessageBox
-    POLYFEM_OT_ShowMessageBox,
+        # ShowMessageBox
+        POLYFEM_OT_ShowMessageBox,
 
-    # Add more classes here...
-    PullDockerImages
-]
+        # Add more classes here...
+        PullDockerImages
+    ], PolyFEMSettings, PolyFEMObjectProperties
 
 def is_class_registered(cls):
     """Check if a class is already registered in Blender."""
-    try:
-        bpy.utils.unregister_class(cls)
-    except RuntimeError:
-        pass  # Class wasn't registered, so we can ignore this error.
+    # bpy_struct exposes is_registered; avoids probing with unregister_class and catching RuntimeError
+    return getattr(cls, "is_registered", False)
 
 def register():
     """Register all classes and set up PointerProperties."""
@@ -127,22 +154,16 @@ def register():
     # Install required packages in the background
     background_install_packages(REQUIRED_PACKAGES, modules_path)
 
-    bl_info = {
-        "name": "PolyFem",
-        "author": "Antoine Boucher",
-        "version": (1, 0, 14),
-        "blender": (4, 2, 0),
-        "location": "View3D > Sidebar > Physics",
-        "description": "PolyFEM simulation plugin for Blender",
-        "category": "Object",
-        "wiki_url": "https://github.com/ETSTribology/PolyFEMBlenderPlugin",
-    }
-
-
     try:
+        loaded_classes, PolyFEMSettings, PolyFEMObjectProperties = load_classes()
+        classes[:] = loaded_classes
+
+        register_class = bpy.utils.register_class
+        unregister_class = bpy.utils.unregister_class
         for cls in classes:
-            is_class_registered(cls)  # Unregister class if already registered
-            bpy.utils.register_class(cls)  # Then register the class
+            if is_class_registered(cls):
+                unregister_class(cls)  # Unregister class if already registered
+            register_class(cls)  # Then register the class
 
         # Register PointerProperties
         bpy.types.Scene.polyfem_settings = bpy.props.PointerProperty(type=PolyFEMSettings)
@@ -158,28 +179,16 @@ def register():
 def unregister():
     """Unregister all classes and remove PointerProperties."""
     try:
-
-        bl_info = {
-            "name": "PolyFem",
-            "author": "Antoine Boucher",
-            "version": (1, 0, 14),
-            "blender": (4, 2, 0),
-            "location": "View3D > Sidebar > Physics",
-            "description": "PolyFEM simulation plugin for Blender",
-            "category": "Object",
-            "wiki_url": "https://github.com/ETSTribology/PolyFEMBlenderPlugin",
-        }
-
-
         # Unregister PointerProperties first to avoid dependency issues
-        if hasattr(bpy.types.Scene, "polyfem_settings"):
-            del bpy.types.Scene.polyfem_settings
-        if hasattr(bpy.types.Object, "polyfem_props"):
-            del bpy.types.Object.polyfem_props
+        for owner, attr in ((bpy.types.Scene, "polyfem_settings"), (bpy.types.Object, "polyfem_props")):
+            if getattr(owner, attr, None) is not None:
+                delattr(owner, attr)
 
         # Unregister classes in reverse order to handle dependencies correctly
+        unregister_class = bpy.utils.unregister_class
         for cls in reversed(classes):
-            is_class_registered(cls)
+            if is_class_registered(cls):
+                unregister_class(cls)
 
         logger.info(f"{bl_info.get('name', 'Addon')} unregistered successfully.")
 
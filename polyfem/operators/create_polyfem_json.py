@@ -2,14 +2,17 @@ import bpy
 import json
 import os
 import subprocess
-import bmesh
-import math
 import platform
-from mathutils import Vector
-from bpy.props import StringProperty, BoolProperty, FloatProperty, EnumProperty, IntProperty
+import concurrent.futures
+import numpy as np
+from bpy.props import StringProperty, EnumProperty
 from bpy.types import Operator
 import logging
-import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the standard library encoder
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -41,15 +44,112 @@ class PullDockerImages(bpy.types.Operator):
             display_message("Docker is not installed. Please install Docker to proceed.", icon='ERROR')
             return {'CANCELLED'}
 
+# Where each PolyFEMSettings attribute goes in the PolyFEM JSON; a tuple of attributes becomes a list
+JSON_SETTINGS_SCHEMA = (
+    ("contact/enabled", "contact_enabled"),
+    ("contact/dhat", "contact_dhat"),
+    ("contact/friction_coefficient", "contact_friction_coefficient"),
+    ("contact/epsv", "contact_epsv"),
+    ("time/integrator", "time_integrator"),
+    ("time/tend", "time_tend"),
+    ("time/dt", "time_dt"),
+    ("space/advanced/bc_method", "space_bc_method"),
+    ("boundary_conditions/rhs", ("boundary_rhs_x", "boundary_rhs_y", "boundary_rhs_z")),
+    ("solver/linear/solver", "solver_linear_solver"),
+    ("solver/nonlinear/x_delta", "solver_nonlinear_x_delta"),
+    ("solver/advanced/lump_mass_matrix", "solver_advanced_lump_mass_matrix"),
+    ("solver/contact/friction_convergence_tol", "solver_contact_friction_convergence_tol"),
+    ("solver/contact/friction_iterations", "solver_contact_friction_iterations"),
+    ("output/json", "output_json"),
+    ("output/paraview/file_name", "output_paraview_file_name"),
+    ("output/paraview/options/material", "output_paraview_material"),
+    ("output/paraview/options/body_ids", "output_paraview_body_ids"),
+    ("output/paraview/options/tensor_values", "output_paraview_tensor_values"),
+    ("output/paraview/options/nodes", "output_paraview_nodes"),
+    ("output/paraview/vismesh_rel_area", "output_paraview_vismesh_rel_area"),
+    ("output/advanced/save_solve_sequence_debug", "output_advanced_save_solve_sequence_debug"),
+    ("output/advanced/save_time_sequence", "output_advanced_save_time_sequence"),
+)
+JSON_SETTINGS_PATHS = tuple((tuple(path.split("/")), attrs) for path, attrs in JSON_SETTINGS_SCHEMA)
+
+def set_json_path(data, keys, value):
+    """Set data[k0][k1]...[kn] = value, creating intermediate dicts as needed."""
+    for key in keys[:-1]:
+        data = data.setdefault(key, {})
+    data[keys[-1]] = value
+
+def settings_to_json(settings):
+    """Build the settings part of the PolyFEM JSON from JSON_SETTINGS_SCHEMA."""
+    json_data = {}
+    for keys, attrs in JSON_SETTINGS_PATHS:
+        if isinstance(attrs, tuple):
+            value = [getattr(settings, attr) for attr in attrs]
+        else:
+            value = getattr(settings, attrs)
+        set_json_path(json_data, keys, value)
+    return json_data
+
+# Binary STL triangle record: facet normal, three vertices and a 2-byte attribute count
+STL_RECORD_DTYPE = np.dtype([('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)), ('attribute', '<u2')])
+
+def write_binary_stl(filepath, coords, triangles):
+    """Write a triangle mesh given as vertex coordinates and index triplets to a binary STL file."""
+    tri_coords = coords[triangles]
+    normals = np.cross(tri_coords[:, 1] - tri_coords[:, 0], tri_coords[:, 2] - tri_coords[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
+
+    records = np.zeros(len(triangles), dtype=STL_RECORD_DTYPE)
+    records['normal'] = normals
+    records['vertices'] = tri_coords
+
+    with open(filepath, 'wb') as stl_file:
+        stl_file.write(bytes(80))
+        stl_file.write(np.uint32(len(triangles)).astype('<u4').tobytes())
+        stl_file.write(records.tobytes())
+
+def to_world(coords, matrix_world):
+    """Apply a 4x4 world matrix (as a NumPy array) to an (N, 3) array of points."""
+    return coords @ matrix_world[:3, :3].T + matrix_world[:3, 3]
+
+def format_rows(line_format, array):
+    """Format every row of a 2D array with one %-operation over the whole flattened array."""
+    # np.savetxt formats row by row in Python; repeating the line format lets the C formatter do it in one pass
+    return (line_format * len(array)) % tuple(array.ravel().tolist())
+
+def write_obj(filepath, coords, normals, triangles):
+    """Write a triangle mesh with per-vertex normals to an OBJ file; faces reuse the vertex index for the normal."""
+    faces = np.repeat(triangles + 1, 2, axis=1)  # OBJ indices are 1-based
+
+    with open(filepath, 'w') as obj_file:
+        obj_file.writelines((
+            format_rows('v %.6f %.6f %.6f\n', coords),
+            format_rows('vn %.4f %.4f %.4f\n', normals),
+            format_rows('f %d//%d %d//%d %d//%d\n', faces),
+        ))
+
+def run_tetwild_command(command, write_future):
+    """Run a TetWild command once the STL it reads has been written."""
+    write_future.result()
+    # TetWild's progress log can be large and is never inspected; only stderr is kept for reporting
+    return subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
 def display_message(message, title="Notification", icon='INFO'):
     """Display a popup message immediately."""
     bpy.ops.polyfem.show_message_box('INVOKE_DEFAULT', message=message, title=title, icon=icon)
 
+_docker_available = False
+
 def is_docker_installed():
     """Check if Docker is installed and available on the machine."""
+    global _docker_available
+    # Only a positive result is remembered so that installing Docker mid-session is still picked up
+    if _docker_available:
+        return True
     try:
         result = subprocess.run(["docker", "--version"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return result.returncode == 0
+        _docker_available = result.returncode == 0
+        return _docker_available
     except Exception as e:
         logger.error(f"Docker not found: {e}")
         return False
@@ -121,8 +221,7 @@ class PolyFEMApplyMaterial(Operator):
             # Ensure a unique material ID is assigned
             if "material_id" not in obj:
                 # Get the highest material_id used in the scene and assign a new unique ID
-                used_ids = [o.get("material_id", 0) for o in bpy.context.scene.objects if "material_id" in o]
-                next_id = max(used_ids, default=0) + 1
+                next_id = max((o["material_id"] for o in context.scene.objects if "material_id" in o), default=0) + 1
                 obj["material_id"] = next_id
             else:
                 # Keep the same material ID if it already exists
@@ -130,10 +229,9 @@ class PolyFEMApplyMaterial(Operator):
 
             # Create or get an existing material based on the selected material properties
             material_name = settings.selected_material
-            if material_name not in bpy.data.materials:
+            mat = bpy.data.materials.get(material_name)  # One name lookup instead of a membership test plus an index
+            if mat is None:
                 mat = bpy.data.materials.new(name=material_name)
-            else:
-                mat = bpy.data.materials[material_name]
 
             # Set material properties (for later visualization or export)
             mat["material_type"] = settings.materials_type
@@ -167,9 +265,35 @@ class CreatePolyFemJSONOperator(Operator):
     bl_description = "Generate a JSON configuration file for PolyFEM simulation and export selected meshes"
     bl_options = {'REGISTER', 'UNDO'}
 
+    # Mesh data is read from Blender on the main thread; the file writes are done here
+    write_executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+    # TetWild containers are multi-threaded themselves, so only a few run at once
+    tetwild_executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+
+    # Export format -> writer method name, resolved once per object in export_mesh
+    mesh_writers = {
+        'STL': 'export_mesh_to_stl',
+        'OBJ': 'export_mesh_to_obj',
+        'MSH': 'export_mesh_for_tetwild',
+    }
+    unsupported_formats = {
+        'FBX': "FBX export is not supported without the FBX addon.",
+        'GLTF': "GLTF export is not supported without the GLTF addon.",
+    }
+
+    # Set by invoke: only interactive runs go modal, so scripted calls return once the JSON is written
+    _run_modal = False
+
+    def invoke(self, context, event):
+        self._run_modal = True
+        return self.execute(context)
+
     def execute(self, context):
+        self._pending_writes = []
+        self._tetwild_jobs = []
+
         # Only meshes can be exported
-        selected_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        selected_objects = tuple(obj for obj in context.selected_objects if obj.type == 'MESH')
         settings = context.scene.polyfem_settings
 
         if settings.export_selected_only and not selected_objects:
@@ -177,7 +301,7 @@ class CreatePolyFemJSONOperator(Operator):
             display_message("No selected objects to export.", icon='ERROR')
             return {'CANCELLED'}
         elif not selected_objects and not settings.export_selected_only:
-            selected_objects = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
+            selected_objects = tuple(obj for obj in context.scene.objects if obj.type == 'MESH')
             logger.info(f"Selected objects: {selected_objects}")
 
         project_path = bpy.path.abspath(settings.export_path)
@@ -217,29 +341,93 @@ class CreatePolyFemJSONOperator(Operator):
                 return {'CANCELLED'}
 
         geometry_list = []
-        docker_futures = []
 
-        for obj in selected_objects:
-            if obj.type != 'MESH':
-                self.report({'WARNING'}, f"Skipping non-mesh object '{obj.name}'.")
-                display_message(f"Skipping non-mesh object '{obj.name}'.", icon='WARNING')
-                continue
+        # Leave edit mode once, before any mesh is evaluated, so pending edits are flushed to the mesh
+        if context.mode != 'OBJECT':
+            try:
+                bpy.ops.object.mode_set(mode='OBJECT')
+            except RuntimeError:
+                self.report({'WARNING'}, "Could not set mode to OBJECT. Proceeding anyway.")
+                display_message("Could not set mode to OBJECT. Proceeding anyway.", icon='WARNING')
+
+        # Scene settings consulted for every object; each read goes through the RNA property system
+        export_point_selection = settings.export_point_selection
+        tetwild_mode = settings.execution_mode_tetwild
 
-            obj_data = self.process_object(obj, output_mesh_dir, settings, context)
+        geometry_names = []  # Object name of each geometry_list entry, to drop the ones whose file failed to write
+
+        for obj in selected_objects:
+            obj_data = self.process_object(obj, output_mesh_dir, settings, context, export_point_selection, tetwild_mode)
             if obj_data is None:
                 self.report({'ERROR'}, f"Failed to process object '{obj.name}'.")
                 display_message(f"Failed to process object '{obj.name}'.", icon='ERROR')
                 continue
 
             geometry_list.append(obj_data)
+            geometry_names.append(obj.name)
+
+        # Like a failed TetWild run, a failed write only drops that object from the export
+        failed_objects = self.wait_for_pending_writes()
+        if failed_objects:
+            geometry_list = [obj_data for obj_name, obj_data in zip(geometry_names, geometry_list) if obj_name not in failed_objects]
+
+        if self._tetwild_jobs:
+            self.report({'INFO'}, "Waiting for all Docker tasks to complete...")
+            display_message("Waiting for all Docker tasks to complete...", icon='INFO')
+            if self._run_modal and context.window is not None:
+                # Poll the TetWild jobs from a timer so the UI stays responsive; modal() writes the JSON
+                self._finish_args = (json_data, geometry_list, json_path, output_mesh_dir)
+                window_manager = context.window_manager
+                self._timer = window_manager.event_timer_add(0.5, window=context.window)
+                window_manager.modal_handler_add(self)
+                return {'RUNNING_MODAL'}
+            # Scripted call or no window to poll from (e.g. background mode): wait in place
+            geometry_list = self.collect_tetwild_results(geometry_list)
+
+        return self.finish_export(json_data, geometry_list, json_path, output_mesh_dir)
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.cancel(context)
+            self.report({'WARNING'}, "Export cancelled; the JSON file was not written.")
+            return {'CANCELLED'}
 
+        if event.type != 'TIMER' or not all(job[0].done() for job in self._tetwild_jobs):
+            return {'PASS_THROUGH'}
+
+        context.window_manager.event_timer_remove(self._timer)
+        json_data, geometry_list, json_path, output_mesh_dir = self._finish_args
+        geometry_list = self.collect_tetwild_results(geometry_list)
+        return self.finish_export(json_data, geometry_list, json_path, output_mesh_dir)
+
+    def cancel(self, context):
+        """Stop polling and abandon the TetWild runs that have not finished."""
+        context.window_manager.event_timer_remove(self._timer)
+        for future, input_file, output_file, container_name in self._tetwild_jobs:
+            if not future.cancel() and not future.done():
+                # Already running: removing its container ends the docker run
+                self.cleanup_docker_container(container_name)
+        self._tetwild_jobs.clear()
+
+    def collect_tetwild_results(self, geometry_list):
+        """Report the queued TetWild runs and drop the objects whose MSH could not be generated."""
+        failed_meshes = self.wait_for_tetwild_jobs()
+        self.report({'INFO'}, "All Docker tasks completed.")
+        display_message("All Docker tasks completed.", icon='INFO')
+        return [obj_data for obj_data in geometry_list if obj_data["mesh"] not in failed_meshes]
+
+    def finish_export(self, json_data, geometry_list, json_path, output_mesh_dir):
+        """Write the JSON configuration file once every mesh has been exported."""
         json_data["geometry"] = geometry_list
 
         # Write the JSON configuration file
         try:
-            self.write_json_file(json_data, json_path)
-            self.report({'INFO'}, f"JSON file created at '{json_path}'")
-            display_message(f"JSON file created at '{json_path}'", icon='INFO')
+            if self.write_json_file(json_data, json_path):
+                self.report({'INFO'}, f"JSON file created at '{json_path}'")
+                display_message(f"JSON file created at '{json_path}'", icon='INFO')
+            else:
+                self.report({'INFO'}, f"JSON file at '{json_path}' is unchanged")
+                display_message(f"JSON file at '{json_path}' is unchanged", icon='INFO')
         except Exception as e:
             self.report({'ERROR'}, f"Failed to write JSON file: {e}")
             display_message(f"Failed to write JSON file: {e}", icon='ERROR')
@@ -248,105 +436,105 @@ class CreatePolyFemJSONOperator(Operator):
         self.report({'INFO'}, f"Meshes exported successfully in '{output_mesh_dir}'")
         display_message(f"Meshes exported successfully in '{output_mesh_dir}'", icon='INFO')
 
-        # Handle Docker tasks synchronously if any
-        if docker_futures:
-            self.report({'INFO'}, "Waiting for all Docker tasks to complete...")
-            display_message("Waiting for all Docker tasks to complete...", icon='INFO')
-            concurrent.futures.wait(docker_futures)
-            self.report({'INFO'}, "All Docker tasks completed.")
-            display_message("All Docker tasks completed.", icon='INFO')
-
         return {'FINISHED'}
 
-    def process_object(self, obj, output_dir, settings, context):
+    def process_object(self, obj, output_dir, settings, context, export_point_selection, tetwild_mode):
         """Process an individual object and collect its data."""
+        # Read each RNA attribute once; every access crosses the Python/C boundary
+        name = obj.name
+        polyfem_props = obj.polyfem_props
+        material_id = obj.get("material_id", 0)
+        export_type = polyfem_props.export_type.upper()
+
         obj_data = {}
-        obj_data["volume_selection"] = obj.get("material_id", 0)
-        obj_data["is_obstacle"] = getattr(obj, "polyfem_props", {}).get("is_obstacle", False)
-        obj_data["export_type"] = obj.polyfem_props.export_type.upper()
+        obj_data["volume_selection"] = material_id
+        obj_data["is_obstacle"] = polyfem_props.is_obstacle
+        obj_data["export_type"] = export_type
 
-        print(f"Processing object '{obj.name}' with export type: {obj_data['export_type']}")
+        print(f"Processing object '{name}' with export type: {export_type}")
 
         # Retrieve the export type from the object's properties
-        logger.info(f"Export type for '{obj.name}': {obj_data['export_type']}")
+        logger.info(f"Export type for '{name}': {export_type}")
 
-        mesh_filename = f"{obj.name}.{obj_data['export_type'].lower()}"
+        mesh_filename = f"{name}.{export_type.lower()}"
         mesh_filepath = os.path.join(output_dir, mesh_filename)
-        success = self.export_mesh(obj, mesh_filepath, settings)
-        if not success:
-            self.report({'ERROR'}, f"Failed to export mesh for object '{obj.name}'")
-            display_message(f"Failed to export mesh for object '{obj.name}'", icon='ERROR')
+
+        # Converted once per object and shared by the mesh writers and the point selection
+        matrix_world = np.array(obj.matrix_world, dtype=np.float32)
+
+        # Evaluate modifiers and triangulate once; every writer below reads this mesh.
+        # Without modifiers or shape keys the evaluated mesh equals obj.data, so skip the copy
+        obj_eval = None
+        mesh = obj.data
+        if obj.modifiers or mesh.shape_keys is not None:
+            depsgraph = context.evaluated_depsgraph_get()
+            obj_eval = obj.evaluated_get(depsgraph)
+            mesh = obj_eval.to_mesh()
+        try:
+            mesh.calc_loop_triangles()
+            queued_write = self.export_mesh(obj, mesh, mesh_filepath, export_type, matrix_world)
+        finally:
+            if obj_eval is not None:
+                obj_eval.to_mesh_clear()
+        if not queued_write:
+            self.report({'ERROR'}, f"Failed to export mesh for object '{name}'")
+            display_message(f"Failed to export mesh for object '{name}'", icon='ERROR')
             return None
 
         obj_data["mesh"] = mesh_filename
-        obj_data["material"] = obj.get("material_id", 0)
+        obj_data["material"] = material_id
 
-        if settings.export_point_selection:
-            point_selection = self.get_point_selection(obj, context)
+        if export_point_selection:
+            point_selection = self.get_point_selection(obj, matrix_world)
             if point_selection:
                 obj_data["point_selection"] = point_selection
 
-        if obj_data["export_type"] == 'MSH':
-            temp_stl_filepath = os.path.join(os.path.dirname(mesh_filepath), f"{obj.name}_temp.stl")
-            success_stl = self.export_mesh_to_stl(obj, temp_stl_filepath)
-            if not success_stl:
-                self.report({'ERROR'}, f"Failed to export {obj.name} to STL format for TetWild.")
-                display_message(f"Failed to export {obj.name} to STL format for TetWild.", icon='ERROR')
-                return None
-
-            # Define output MSH filepath
-            msh_filepath = mesh_filepath
-            if settings.execution_mode_tetwild == 'DOCKER':
+        if export_type == 'MSH':
+            # export_mesh has already queued the temporary STL that TetWild reads
+            if tetwild_mode == 'DOCKER':
                 # Use TetWild via Docker to export the mesh as MSH
-                success = self.export_mesh_using_tetwild(obj, output_dir, settings)
+                write_future, temp_stl_filepath = queued_write
+                success = self.export_mesh_using_tetwild(temp_stl_filepath, write_future, mesh_filepath, settings)
                 if not success:
                     return None
-            elif settings.execution_mode_tetwild == 'EXECUTABLE':
+            elif tetwild_mode == 'EXECUTABLE':
                 # Use the PolyFem executable to export the mesh as MSH
-                success = self.export_mesh_using_executable(obj, output_dir, settings.executable_path_polyfem)
+                success = self.export_mesh_using_executable(obj, mesh_filepath, settings.executable_path_polyfem)
                 if not success:
-                    self.report({'ERROR'}, f"Failed to export {obj.name} using PolyFem executable.")
-                    display_message(f"Failed to export {obj.name} using PolyFem executable.", icon='ERROR')
+                    self.report({'ERROR'}, f"Failed to export {name} using PolyFem executable.")
+                    display_message(f"Failed to export {name} using PolyFem executable.", icon='ERROR')
                     return None
 
+        # The mesh writers bake matrix_world into the vertices, so PolyFEM must not apply it a second time
         obj_data["transformation"] = {
-            "translation": list(obj.location),
-            "rotation": list(obj.rotation_quaternion.to_euler()),
-            "scale": list(obj.scale),
+            "translation": [0.0, 0.0, 0.0],
+            "rotation": [0.0, 0.0, 0.0],
+            "scale": [1.0, 1.0, 1.0],
         }
 
         return obj_data
 
-    def export_mesh_using_tetwild(self, obj, output_dir, settings):
+    def export_mesh_using_tetwild(self, temp_stl_filepath, write_future, msh_filepath, settings):
         """Use TetWild to export the mesh as MSH."""
         try:
-            # Export mesh to STL first
-            temp_stl_filepath = os.path.join(output_dir, f"{obj.name}_temp.stl")
-            success_stl = self.export_mesh_to_stl(obj, temp_stl_filepath)
-
-            if success_stl:
-                msh_filepath = os.path.join(output_dir, f"{obj.name}.msh")
-                success = self.run_tetwild(temp_stl_filepath, msh_filepath, settings)
-                return success
-            return False
+            # TetWild starts once write_future has finished writing the temporary STL
+            return self.run_tetwild(temp_stl_filepath, msh_filepath, settings, write_future)
         except Exception as e:
             self.report({'ERROR'}, f"Error using TetWild: {e}")
             display_message(f"Error using TetWild: {e}", icon='ERROR')
             return False
 
-    def export_mesh_using_executable(self, obj, output_dir, executable_path):
+    def export_mesh_using_executable(self, obj, mesh_filepath, executable_path):
         """Use the PolyFem executable to export the mesh."""
         if not os.path.isfile(executable_path):
             self.report({'ERROR'}, f"Executable not found at path: {executable_path}")
             display_message(f"Executable not found at path: {executable_path}", icon='ERROR')
             return False
 
-        mesh_filepath = os.path.join(output_dir, f"{obj.name}.msh")
-
-        command = [executable_path, '--input', mesh_filepath, '--output', output_dir]
+        command = [executable_path, '--input', mesh_filepath, '--output', os.path.dirname(mesh_filepath)]
 
         try:
-            result = subprocess.run(command, check=True, capture_output=True, text=True)
+            subprocess.run(command, check=True, capture_output=True, text=True)
             self.report({'INFO'}, f"Mesh exported successfully using executable for '{obj.name}'.")
             display_message(f"Mesh exported successfully using executable for '{obj.name}'.", icon='INFO')
             return True
@@ -358,78 +546,48 @@ class CreatePolyFemJSONOperator(Operator):
             display_message(f"Unexpected error: {e}", icon='ERROR')
         return False
 
-    def export_mesh(self, obj, mesh_filepath, settings):
-        """Export the mesh of an object based on the selected format."""
-        try:
-            bpy.ops.object.mode_set(mode='OBJECT')
-        except RuntimeError:
-            self.report({'WARNING'}, "Could not set mode to OBJECT. Proceeding anyway.")
-            display_message("Could not set mode to OBJECT. Proceeding anyway.", icon='WARNING')
-
-        # Deselect all objects
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        bpy.context.view_layer.objects.active = obj
-
-        export_format = obj.polyfem_props.export_type.upper()
+    def export_mesh(self, obj, mesh, mesh_filepath, export_format, matrix_world):
+        """Export the mesh of an object based on the selected format; returns the queued (future, filepath) write or False."""
+        # The mesh writers read the evaluated mesh directly, so selection and the active object are left alone
+        writer_name = self.mesh_writers.get(export_format)
+        if writer_name is None:
+            message = self.unsupported_formats.get(export_format, f"Unsupported export format: {export_format}")
+            self.report({'ERROR'}, message)
+            display_message(message, icon='ERROR')
+            return False
 
         try:
-            if export_format == 'STL':
-                return self.export_mesh_to_stl(obj, mesh_filepath)
-            elif export_format == 'OBJ':
-                return self.export_mesh_to_obj(obj, mesh_filepath)
-            elif export_format == 'FBX':
-                self.report({'ERROR'}, "FBX export is not supported without the FBX addon.")
-                display_message("FBX export is not supported without the FBX addon.", icon='ERROR')
-                return False
-            elif export_format == 'GLTF':
-                self.report({'ERROR'}, "GLTF export is not supported without the GLTF addon.")
-                display_message("GLTF export is not supported without the GLTF addon.", icon='ERROR')
-                return False
-            elif export_format == 'MSH':
-                # Export to STL format for TetWild
-                temp_stl_filepath = os.path.join(os.path.dirname(mesh_filepath), f"{obj.name}_temp.stl")
-                success = self.export_mesh_to_stl(obj, temp_stl_filepath)
-                if not success:
-                    self.report({'ERROR'}, f"Failed to export {obj.name} to STL format for TetWild.")
-                    display_message(f"Failed to export {obj.name} to STL format for TetWild.", icon='ERROR')
-                    return False
-                # TetWild processing is handled separately
-                return True
-            else:
-                self.report({'ERROR'}, f"Unsupported export format: {export_format}")
-                display_message(f"Unsupported export format: {export_format}", icon='ERROR')
-                return False
+            return getattr(self, writer_name)(obj, mesh, mesh_filepath, matrix_world)
         except Exception as e:
             self.report({'ERROR'}, f"Error exporting {obj.name}: {e}")
             display_message(f"Error exporting {obj.name}: {e}", icon='ERROR')
             return False
 
-    def export_mesh_to_stl(self, obj, filepath):
-        try:
-            bpy.ops.object.select_all(action='DESELECT')
-
-            if bpy.context.object.mode != 'OBJECT':
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-            obj.select_set(True)
+    def export_mesh_for_tetwild(self, obj, mesh, mesh_filepath, matrix_world):
+        """Export the temporary STL that TetWild turns into the MSH file."""
+        temp_stl_filepath = os.path.join(os.path.dirname(mesh_filepath), f"{obj.name}_temp.stl")
+        queued_write = self.export_mesh_to_stl(obj, mesh, temp_stl_filepath, matrix_world)
+        if not queued_write:
+            self.report({'ERROR'}, f"Failed to export {obj.name} to STL format for TetWild.")
+            display_message(f"Failed to export {obj.name} to STL format for TetWild.", icon='ERROR')
+            return False
+        # TetWild processing is handled separately, once this write has finished
+        return queued_write
 
-            # Define export parameters
-            export_params = {
-                "filepath": filepath,
-                "check_existing": False,
-                "export_selected_objects": True,
-                "ascii_format": False
-            }
+    def export_mesh_to_stl(self, obj, mesh, filepath, matrix_world):
+        """Exports an object's evaluated, triangulated mesh, in world space, to a binary STL file."""
+        try:
+            coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", coords)
+            triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+            mesh.loop_triangles.foreach_get("vertices", triangles)
 
-            # Perform the STL export
-            bpy.ops.wm.stl_export(**export_params)
+            coords = to_world(coords.reshape(-1, 3), matrix_world)
 
-            # Report success
-            obj_name = ', '.join([obj.name for obj in bpy.context.selected_objects])
-            self.report({'INFO'}, f"Exported STL for objects '{obj_name}' at '{filepath}'")
-            display_message(f"Exported STL for objects '{obj_name}' at '{filepath}'", icon='INFO')
-            return True
+            # Writing the file does not touch Blender data, so overlap it with the next object
+            future = self.write_executor.submit(write_binary_stl, filepath, coords, triangles.reshape(-1, 3))
+            self._pending_writes.append((future, obj.name, filepath))
+            return future, filepath
 
         except Exception as e:
             # Report failure
@@ -437,83 +595,101 @@ class CreatePolyFemJSONOperator(Operator):
             display_message(f"Failed to export STL: {e}", icon='ERROR')
             return False
 
-    def export_mesh_to_obj(self, obj, filepath):
-        """Exports the mesh data of an object to an OBJ file."""
-
+    def wait_for_pending_writes(self):
+        """Wait for queued mesh file writes, report their outcome and return the objects whose write failed."""
+        failed = set()
+        for future, obj_name, filepath in self._pending_writes:
+            try:
+                future.result()
+                self.report({'INFO'}, f"Exported mesh for object '{obj_name}' at '{filepath}'")
+            except Exception as e:
+                self.report({'ERROR'}, f"Failed to write mesh for object '{obj_name}': {e}")
+                display_message(f"Failed to write mesh for object '{obj_name}': {e}", icon='ERROR')
+                failed.add(obj_name)
+        self._pending_writes.clear()
+        return failed
+
+    def export_mesh_to_obj(self, obj, mesh, filepath, matrix_world):
+        """Exports an object's evaluated, triangulated mesh, in world space, to an OBJ file."""
         try:
-            bpy.ops.object.select_all(action='DESELECT')
-
-            if bpy.context.object.mode != 'OBJECT':
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-            obj.select_set(True)
-
-            # Define export parameters
-            export_params = {
-                "filepath": filepath,
-                "check_existing": False,
-                "export_selected_objects": True,
-                "ascii_format": False
-            }
-
-            # Perform the obj export
-            bpy.ops.wm.obj_export(**export_params)
-
-            # Report success
-            obj_name = ', '.join([obj.name for obj in bpy.context.selected_objects])
-            self.report({'INFO'}, f"Exported STL for objects '{obj_name}' at '{filepath}'")
-            display_message(f"Exported STL for objects '{obj_name}' at '{filepath}'", icon='INFO')
-            return True
+            coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", coords)
+            # Vertex normals are cached on the mesh, unlike per-loop normals
+            normals = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertex_normals.foreach_get("vector", normals)
+            triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+            mesh.loop_triangles.foreach_get("vertices", triangles)
+
+            coords = to_world(coords.reshape(-1, 3), matrix_world)
+            normals = normals.reshape(-1, 3) @ np.linalg.inv(matrix_world[:3, :3])
+            lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+            np.divide(normals, lengths, out=normals, where=lengths > 0)
+
+            future = self.write_executor.submit(write_obj, filepath, coords, normals, triangles.reshape(-1, 3))
+            self._pending_writes.append((future, obj.name, filepath))
+            return future, filepath
 
         except Exception as e:
             # Report failure
-            self.report({'ERROR'}, f"Failed to export STL: {e}")
-            display_message(f"Failed to export STL: {e}", icon='ERROR')
+            self.report({'ERROR'}, f"Failed to export OBJ: {e}")
+            display_message(f"Failed to export OBJ: {e}", icon='ERROR')
             return False
 
-    def run_tetwild(self, input_file, output_file, settings):
-        """Run TetWild to generate an MSH file from a mesh with enhanced parameters."""
+    def run_tetwild(self, input_file, output_file, settings, write_future):
+        """Queue a TetWild run that generates an MSH file from a mesh with enhanced parameters."""
+        ideal_edge_length = settings.tetwild_max_tets
+        epsilon = settings.tetwild_min_tets
+        filter_energy = settings.tetwild_mesh_quality * 100
+        max_pass = 80  # Existing parameter
+
+        # Get the absolute path of the input and output directories
+        input_dir = os.path.abspath(os.path.dirname(input_file))
+        output_dir = os.path.abspath(os.path.dirname(output_file))
+
+        # Adjust paths for Windows if necessary
+        if platform.system() == 'Windows':
+            input_dir = input_dir.replace('\\', '/')
+            output_dir = output_dir.replace('\\', '/')
+            if input_dir[1] == ':':
+                input_dir = f'/{input_dir[0].lower()}{input_dir[2:]}'
+            if output_dir[1] == ':':
+                output_dir = f'/{output_dir[0].lower()}{output_dir[2:]}'
+
+        # Build the TetWild Docker command with new parameters
+        container_name = f"tetwild_{os.path.basename(input_file)}"
+        command = [
+            "docker", "run", "--rm", "--name", container_name,
+            "-v", f"{input_dir}:/data",
+            "yixinhu/tetwild:latest",  # Ensure you're using the correct tag
+            "--input", f"/data/{os.path.basename(input_file)}",
+            "--ideal-edge-length", str(ideal_edge_length),
+            "--epsilon", str(epsilon),
+            "--filter-energy", str(filter_energy),
+            "--max-pass", str(max_pass),
+            "--output", f"/data/{os.path.basename(output_file)}"
+        ]
+
+        # Each object's TetWild container is independent, so they run side by side
+        future = self.tetwild_executor.submit(run_tetwild_command, command, write_future)
+        self._tetwild_jobs.append((future, input_file, output_file, container_name))
+        return True
+
+    def wait_for_tetwild_jobs(self):
+        """Wait for queued TetWild runs, report their outcome and return the MSH files that failed."""
+        failed = set()
+        for future, input_file, output_file, container_name in self._tetwild_jobs:
+            if not self.finish_tetwild_job(future, input_file, output_file, container_name):
+                failed.add(os.path.basename(output_file))
+        self._tetwild_jobs.clear()
+        return failed
+
+    def finish_tetwild_job(self, future, input_file, output_file, container_name):
+        """Report the result of a single TetWild run; reporting stays on the main thread."""
         try:
-            ideal_edge_length = settings.tetwild_max_tets
-            epsilon = settings.tetwild_min_tets
-            filter_energy = settings.tetwild_mesh_quality * 100
-            max_pass = 80  # Existing parameter
-
-            # Get the absolute path of the input and output directories
-            input_dir = os.path.abspath(os.path.dirname(input_file))
-            output_dir = os.path.abspath(os.path.dirname(output_file))
-
-            # Adjust paths for Windows if necessary
-            if platform.system() == 'Windows':
-                input_dir = input_dir.replace('\\', '/')
-                output_dir = output_dir.replace('\\', '/')
-                if input_dir[1] == ':':
-                    input_dir = f'/{input_dir[0].lower()}{input_dir[2:]}'
-                if output_dir[1] == ':':
-                    output_dir = f'/{output_dir[0].lower()}{output_dir[2:]}'
-
-            # Build the TetWild Docker command with new parameters
-            container_name = f"tetwild_{os.path.basename(input_file)}"
-            command = [
-                "docker", "run", "--rm", "--name", container_name,
-                "-v", f"{input_dir}:/data",
-                "yixinhu/tetwild:latest",  # Ensure you're using the correct tag
-                "--input", f"/data/{os.path.basename(input_file)}",
-                "--ideal-edge-length", str(ideal_edge_length),
-                "--epsilon", str(epsilon),
-                "--filter-energy", str(filter_energy),
-                "--max-pass", str(max_pass),
-                "--output", f"/data/{os.path.basename(output_file)}"
-            ]
-
-            # Execute the command
-            result = subprocess.run(command, check=True, capture_output=True, text=True)
+            result = future.result()
             self.report({'INFO'}, f"TetWild ran successfully with input: {input_file}")
             display_message(f"TetWild ran successfully with input: {input_file}", icon='INFO')
 
-            if result.stdout:
-                self.report({'INFO'}, f"TetWild Output:\n{result.stdout}")
-                logger.info(f"TetWild Output:\n{result.stdout}")
             if result.stderr:
                 self.report({'WARNING'}, f"TetWild Warnings:\n{result.stderr}")
                 logger.warning(f"TetWild Warnings:\n{result.stderr}")
@@ -563,162 +739,83 @@ class CreatePolyFemJSONOperator(Operator):
         """Create the initial JSON data structure based on settings."""
         materials_list = []  # List of materials for the global materials section
         materials_map = {}  # Map to avoid duplicate materials
-        geometry_list = []  # List of objects (geometry)
+
+        # Scene-wide material defaults; read once instead of once per object
+        default_type = settings.materials_type
+        default_E = settings.materials_E
+        default_nu = settings.materials_nu
+        default_rho = settings.materials_rho
 
         # Loop through all objects and assign materials
         for obj in selected_objects:
-            if obj.type == 'MESH':
-                # Check if the object has custom material properties
-                material_data = {
-                    "id": obj.get("material_id", 0),
-                    "type": obj.get("material_type", settings.materials_type),
-                    "E": round(obj.get("material_E", settings.materials_E), 6),
-                    "nu": round(obj.get("material_nu", settings.materials_nu), 4),
-                    "rho": round(obj.get("material_rho", settings.materials_rho), 6)
-                }
-
-                # Convert the material properties to a tuple (for easy comparison)
-                material_tuple = (material_data["type"], material_data["E"], material_data["nu"], material_data["rho"])
-
-                # Check if the material already exists in the map, if not, add it
-                if material_tuple not in materials_map:
-                    material_id = len(materials_list)
-                    materials_list.append(material_data)
-                    materials_map[material_tuple] = material_id
-                else:
-                    material_id = materials_map[material_tuple]
-
-                # Process the object and assign the material by its ID
-                obj_data = self.process_object(obj, output_dir=context.scene.polyfem_settings.export_path, settings=settings, context=context)
-                if obj_data:
-                    geometry_list.append(obj_data)
+            # Check if the object has custom material properties; copy them in one pass
+            # rather than one ID-property lookup per field
+            custom_props = dict(obj.items())
+            material_data = {
+                "id": custom_props.get("material_id", 0),
+                "type": custom_props.get("material_type", default_type),
+                "E": round(custom_props.get("material_E", default_E), 6),
+                "nu": round(custom_props.get("material_nu", default_nu), 4),
+                "rho": round(custom_props.get("material_rho", default_rho), 6)
+            }
+
+            # Convert the material properties to a tuple (for easy comparison)
+            material_tuple = (material_data["type"], material_data["E"], material_data["nu"], material_data["rho"])
+
+            # Check if the material already exists in the map, if not, add it
+            if material_tuple not in materials_map:
+                materials_map[material_tuple] = len(materials_list)
+                materials_list.append(material_data)
 
         # Final JSON structure
-        json_data = {
-            "contact": {
-                "enabled": settings.contact_enabled,
-                "dhat": settings.contact_dhat,
-                "friction_coefficient": settings.contact_friction_coefficient,
-                "epsv": settings.contact_epsv
-            },
-            "time": {
-                "integrator": settings.time_integrator,
-                "tend": settings.time_tend,
-                "dt": settings.time_dt
-            },
-            "space": {
-                "advanced": {
-                    "bc_method": settings.space_bc_method
-                }
-            },
-            "boundary_conditions": {
-                "rhs": [settings.boundary_rhs_x, settings.boundary_rhs_y, settings.boundary_rhs_z]
-            },
-            "materials": materials_list,
-            "solver": {
-                "linear": {
-                    "solver": settings.solver_linear_solver
-                },
-                "nonlinear": {
-                    "x_delta": settings.solver_nonlinear_x_delta
-                },
-                "advanced": {
-                    "lump_mass_matrix": settings.solver_advanced_lump_mass_matrix
-                },
-                "contact": {
-                    "friction_convergence_tol": settings.solver_contact_friction_convergence_tol,
-                    "friction_iterations": settings.solver_contact_friction_iterations
-                }
-            },
-            "output": {
-                "json": settings.output_json,
-                "paraview": {
-                    "file_name": settings.output_paraview_file_name,
-                    "options": {
-                        "material": settings.output_paraview_material,
-                        "body_ids": settings.output_paraview_body_ids,
-                        "tensor_values": settings.output_paraview_tensor_values,
-                        "nodes": settings.output_paraview_nodes
-                    },
-                    "vismesh_rel_area": settings.output_paraview_vismesh_rel_area
-                },
-                "advanced": {
-                    "save_solve_sequence_debug": settings.output_advanced_save_solve_sequence_debug,
-                    "save_time_sequence": settings.output_advanced_save_time_sequence
-                }
-            },
-            "geometry": geometry_list
-        }
+        json_data = settings_to_json(settings)
+        json_data["materials"] = materials_list
+        # Filled in by execute() once the meshes have been exported
+        json_data["geometry"] = []
 
         return json_data
 
-    def get_point_selection(self, obj, context):
+    def get_point_selection(self, obj, matrix_world):
         """Retrieve the bounding boxes of selected vertices and format them for JSON."""
-        # Save the current mode
-        original_mode = obj.mode
-
         try:
-            # Switch to Object Mode to ensure proper access
-            bpy.ops.object.mode_set(mode='OBJECT')
-            bpy.context.view_layer.objects.active = obj
+            # The vertex select flags live on obj.data; in edit mode they only need flushing, not a mode switch
+            if obj.mode == 'EDIT':
+                obj.update_from_editmode()
 
             # Get the mesh data
             mesh = obj.data
-            selected_verts = [v for v in mesh.vertices if v.select]
+            vertex_count = len(mesh.vertices)
+            selected = np.empty(vertex_count, dtype=bool)
+            mesh.vertices.foreach_get("select", selected)
 
-            if not selected_verts:
+            if not selected.any():
                 return None  # No vertices selected for this object
 
-            # Calculate the bounding box of selected vertices
-            min_coord = Vector((float('inf'), float('inf'), float('inf')))
-            max_coord = Vector((float('-inf'), float('-inf'), float('-inf')))
-
-            for v in selected_verts:
-                global_coord = obj.matrix_world @ v.co
-                min_coord.x = min(min_coord.x, global_coord.x)
-                min_coord.y = min(min_coord.y, global_coord.y)
-                min_coord.z = min(min_coord.z, global_coord.z)
+            coords = np.empty(vertex_count * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", coords)
+            selected_coords = coords.reshape(-1, 3)[selected]
 
-                max_coord.x = max(max_coord.x, global_coord.x)
-                max_coord.y = max(max_coord.y, global_coord.y)
-                max_coord.z = max(max_coord.z, global_coord.z)
+            # Calculate the bounding box of selected vertices, in world space
+            global_coords = to_world(selected_coords, matrix_world)
+            min_coord = global_coords.min(axis=0)
+            max_coord = global_coords.max(axis=0)
 
             # Optionally, calculate relative coordinates based on object's bounding box
-            obj_bbox = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-            obj_min = Vector((
-                min(corner.x for corner in obj_bbox),
-                min(corner.y for corner in obj_bbox),
-                min(corner.z for corner in obj_bbox)
-            ))
-            obj_max = Vector((
-                max(corner.x for corner in obj_bbox),
-                max(corner.y for corner in obj_bbox),
-                max(corner.z for corner in obj_bbox)
-            ))
-
-            # Function to calculate relative positions
-            def get_relative(value, min_obj, max_obj):
-                return (value - min_obj) / (max_obj - min_obj) if max_obj != min_obj else 0.0
-
-            # Calculate relative coordinates
-            rel_min = Vector((
-                get_relative(min_coord.x, obj_min.x, obj_max.x),
-                get_relative(min_coord.y, obj_min.y, obj_max.y),
-                get_relative(min_coord.z, obj_min.z, obj_max.z)
-            ))
-            rel_max = Vector((
-                get_relative(max_coord.x, obj_min.x, obj_max.x),
-                get_relative(max_coord.y, obj_min.y, obj_max.y),
-                get_relative(max_coord.z, obj_min.z, obj_max.z)
-            ))
+            obj_bbox = to_world(np.array(obj.bound_box, dtype=np.float32), matrix_world)
+            obj_min = obj_bbox.min(axis=0)
+            obj_max = obj_bbox.max(axis=0)
+
+            # Calculate relative coordinates; flat axes (zero extent) map to 0.0
+            extent = obj_max - obj_min
+            rel_min = np.zeros(3)
+            np.divide(min_coord - obj_min, extent, out=rel_min, where=extent != 0)
+            rel_max = np.zeros(3)
+            np.divide(max_coord - obj_min, extent, out=rel_max, where=extent != 0)
 
             # Prepare the point selection data
             point_selection = [{
                 "id": 1,  # You may want to adjust the ID or make it dynamic
-                "box": [
-                    [rel_min.x, rel_min.y, rel_min.z],
-                    [rel_max.x, rel_max.y, rel_max.z]
-                ],
+                "box": [rel_min.tolist(), rel_max.tolist()],
                 "relative": True
             }]
 
@@ -730,14 +827,29 @@ class CreatePolyFemJSONOperator(Operator):
             return None
 
     def write_json_file(self, data, json_path):
-        """Write the collected data to a JSON file."""
+        """Write the collected data to a JSON file; returns False when the file already held this content."""
+        if orjson is not None:
+            content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            # Same layout as the orjson branch, so the file does not depend on which encoder is installed
+            content = json.dumps(data, indent=2).encode()
+
+        # Skip the rewrite when the file on disk already holds this exact content
+        if os.path.isfile(json_path):
+            with open(json_path, 'rb') as json_file:
+                if json_file.read() == content:
+                    return False
+
+        # Write to a temporary file and swap it in so readers never see a partial file
+        tmp_path = json_path + ".tmp"
         try:
-            with open(json_path, 'w') as json_file:
-                json.dump(data, json_file, indent=4)
-            self.report({'INFO'}, f"JSON file created at '{json_path}'")
-            display_message(f"JSON file created at '{json_path}'", icon='INFO')
-            return True
-        except Exception as e:
-            self.report({'ERROR'}, f"Failed to create JSON file: {e}")
-            display_message(f"Failed to create JSON file: {e}", icon='ERROR')
-            return False
\ No newline at end of file
+            with open(tmp_path, 'wb') as json_file:
+                json_file.write(content)
+                json_file.flush()
+                os.fsync(json_file.fileno())
+            os.replace(tmp_path, json_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return True
\ No newline at end of file
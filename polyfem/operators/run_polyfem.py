@@ -1,56 +1,42 @@
 import bpy
-import json
 import os
 import subprocess
-import bmesh
-import math
-import platform
 import threading
 import queue
+import collections
+import time
 import concurrent.futures
-from mathutils import Vector
-from bpy.props import StringProperty, BoolProperty, FloatProperty, EnumProperty, IntProperty, PointerProperty
+import numpy as np
 from bpy.types import Operator
 import webbrowser
 import tempfile
-import meshio
 
-# ----------------------------
-# Popup Message Box Operator
-# ----------------------------
-class POLYFEM_OT_ShowMessageBox(Operator):
-    """Show a popup message box"""
-    bl_idname = "polyfem.show_message_box"
-    bl_label = "PolyFem Notification"
-    bl_options = {'REGISTER'}
-
-    message: StringProperty(name="Message") # type: ignore
-    title: StringProperty(name="Title", default="PolyFem Notification") # type: ignore
-    icon: EnumProperty(
-        name="Icon",
-        items=[
-            ('INFO', "Info", "Information"),
-            ('ERROR', "Error", "Error"),
-            ('WARNING', "Warning", "Warning"),
-            ('NONE', "None", "No Icon"),
-        ],
-        default='INFO'
-    ) # type: ignore
-
-    def execute(self, context):
-        return {'FINISHED'}
-
-    def invoke(self, context, event):
-        wm = context.window_manager
-        return wm.invoke_props_dialog(self, width=400)
-
-    def draw(self, context):
-        layout = self.layout
-        layout.label(text=self.message)
-
-    def cancel(self, context):
-        """Override the cancel action to behave like execute"""
-        return self.execute(context)
+# Number of trailing output lines kept from a PolyFem run for the final report
+OUTPUT_TAIL_LINES = 1000
+# Minimum number of seconds between two progress updates in the status bar
+PROGRESS_INTERVAL = 0.5
+
+# Triangles making up the surface of each supported meshio cell type, as local vertex indices
+CELL_TRIANGLES = {
+    "triangle": np.array([[0, 1, 2]]),
+    "quad": np.array([[0, 1, 2], [0, 2, 3]]),
+    "tetra": np.array([[0, 1, 2], [0, 1, 3], [0, 2, 3], [1, 2, 3]]),
+    # Each hexahedron face (front, back, bottom, top, left, right) split into 2 triangles
+    "hexahedron": np.array([
+        [0, 1, 2], [0, 2, 3],
+        [4, 5, 6], [4, 6, 7],
+        [0, 1, 5], [0, 5, 4],
+        [2, 3, 7], [2, 7, 6],
+        [0, 3, 7], [0, 7, 4],
+        [1, 2, 6], [1, 6, 5],
+    ]),
+}
+
+def set_status_text(text):
+    """Show text in the status bar, or restore the default status bar when text is None."""
+    workspace = bpy.context.workspace
+    if workspace is not None:
+        workspace.status_text_set(text)
 
 # ----------------------------
 # Run PolyFem Simulation Operator
@@ -117,13 +103,23 @@ class RunPolyFemSimulationOperator(Operator):
 
     def execute_command(self, command):
         try:
-            result = subprocess.run(command, capture_output=True, text=True, check=True)
-            self.report_queue.put(('INFO', f"Command Output:\n{result.stdout}"))
-            if result.stderr:
-                self.report_queue.put(('WARNING', f"Warnings:\n{result.stderr}"))
+            # Stream merged stdout/stderr line by line; only the tail is kept for the final report
+            output_tail = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+            next_progress = 0.0
+            with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1) as process:
+                for line_count, line in enumerate(process.stdout, 1):
+                    output_tail.append(line)
+                    now = time.monotonic()
+                    if now >= next_progress:
+                        # Throttled so a chatty log does not flood the queue; shown in the status bar
+                        self.report_queue.put(('PROGRESS', f"PolyFem [{line_count} lines]: {line.strip()}"))
+                        next_progress = now + PROGRESS_INTERVAL
+            output = "".join(output_tail)
+            if process.returncode != 0:
+                self.report_queue.put(('ERROR', f"Command failed with exit code {process.returncode}:\n{output}"))
+                return
+            self.report_queue.put(('INFO', f"Command Output:\n{output}"))
             self.report_queue.put(('INFO', "PolyFem simulation completed successfully."))
-        except subprocess.CalledProcessError as e:
-            self.report_queue.put(('ERROR', f"Command failed with error:\n{e.stderr}"))
         except FileNotFoundError:
             self.report_queue.put(('ERROR', "Command not found. Please ensure it is available in the system's PATH."))
         except Exception as e:
@@ -135,12 +131,16 @@ class RunPolyFemSimulationOperator(Operator):
 
         while not self.report_queue.empty():
             level, message = self.report_queue.get()
+            if level == 'PROGRESS':
+                set_status_text(message)
+                continue
             if level == 'ERROR':
                 has_error = True
             output_log.append(message)
             self.report({level}, message)
 
         if not RunPolyFemSimulationOperator._thread.is_alive():
+            set_status_text(None)
             bpy.ops.polyfem.show_message_box(
                 'INVOKE_DEFAULT',
                 message="\n".join(output_log),
@@ -151,9 +151,6 @@ class RunPolyFemSimulationOperator(Operator):
         else:
             return 0.1
 
-    def show_popup(self, message, title, icon):
-        bpy.ops.polyfem.show_message_box('INVOKE_DEFAULT', message=message, title=title, icon=icon)
-
 # ----------------------------
 # Render PolyFem Animation Operator
 # ----------------------------
@@ -209,8 +206,6 @@ class RenderPolyFemAnimationOperator(Operator):
         """Background thread method to handle the animation rendering process."""
         polyfem_settings = context.scene.polyfem_settings
         export_path = bpy.path.abspath(polyfem_settings.export_path)
-        start_frame = 0
-        frame_interval = 1
         scale_factor = 1
 
         if not os.path.exists(export_path):
@@ -390,6 +385,9 @@ class RenderPolyFemAnimationOperator(Operator):
 
     def convert_vtu_to_obj(self, vtu_path, scale_factor=1.0):
         """Convert a VTU file to a deformed OBJ file."""
+        # Imported here: meshio is installed in the background on first registration
+        import meshio
+
         mesh = meshio.read(vtu_path)
         triangle_cells, deformed_points = self.get_triangle_cells(mesh, scale_factor)
 
@@ -416,64 +414,23 @@ class RenderPolyFemAnimationOperator(Operator):
             self.report_queue.put(('WARNING', "No 'solution' data found, using original points."))
             deformed_points = points
 
-        triangles = []
+        triangle_blocks = []
         for cell_block in mesh.cells:
-            if cell_block.type == "triangle":
-                triangles.extend(cell_block.data.tolist())
-            elif cell_block.type == "tetra":
-                triangles.extend(self.get_tetra_faces(cell_block.data))
-            elif cell_block.type == "hexahedron":
-                triangles.extend(self.get_hexa_faces(cell_block.data))
-            elif cell_block.type == "quad":
-                triangles.extend(self.get_quad_faces(cell_block.data))
-            else:
+            face_table = CELL_TRIANGLES.get(cell_block.type)
+            if face_table is None:
                 self.report_queue.put(('WARNING', f"Unsupported cell type '{cell_block.type}' encountered and skipped."))
+                continue
+            # Index every cell with the face table at once: (cells, faces, 3) -> (cells * faces, 3)
+            triangle_blocks.append(np.asarray(cell_block.data)[:, face_table].reshape(-1, 3))
+
+        if triangle_blocks:
+            triangles = np.concatenate(triangle_blocks).astype(np.int64, copy=False)
+        else:
+            triangles = np.empty((0, 3), dtype=np.int64)
 
         self.report_queue.put(('INFO', f"Converted cells to triangles. Total triangles: {len(triangles)}"))
-        # Convert all triangle indices to integers
-        triangles = [list(map(int, face)) for face in triangles]
         return triangles, deformed_points
 
-    def get_tetra_faces(self, cells):
-        """Extract triangular faces from tetrahedral cells."""
-        triangles = []
-        for cell in cells:
-            triangles.append([cell[0], cell[1], cell[2]])
-            triangles.append([cell[0], cell[1], cell[3]])
-            triangles.append([cell[0], cell[2], cell[3]])
-            triangles.append([cell[1], cell[2], cell[3]])
-        return triangles
-
-    def get_hexa_faces(self, cells):
-        """Extract triangular faces from hexahedral cells."""
-        triangles = []
-        for cell in cells:
-            # Each hexahedron has 6 faces; each face can be split into 2 triangles
-            faces = [
-                [cell[0], cell[1], cell[2], cell[3]],  # Front
-                [cell[4], cell[5], cell[6], cell[7]],  # Back
-                [cell[0], cell[1], cell[5], cell[4]],  # Bottom
-                [cell[2], cell[3], cell[7], cell[6]],  # Top
-                [cell[0], cell[3], cell[7], cell[4]],  # Left
-                [cell[1], cell[2], cell[6], cell[5]],  # Right
-            ]
-            for face in faces:
-                triangles.append([face[0], face[1], face[2]])
-                triangles.append([face[0], face[2], face[3]])
-        return triangles
-
-    def get_quad_faces(self, cells):
-        """Convert quads to triangles."""
-        triangles = []
-        for quad in cells:
-            triangles.append([quad[0], quad[1], quad[2]])
-            triangles.append([quad[0], quad[2], quad[3]])
-        return triangles
-
-    def show_popup(self, message, title, icon):
-        """Helper function to display a popup message box"""
-        bpy.ops.polyfem.show_message_box('INVOKE_DEFAULT', message=message, title=title, icon=icon)
-
 # ----------------------------
 # Open PolyFem Documentation Operator
 # ----------------------------
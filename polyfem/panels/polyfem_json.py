@@ -71,16 +71,19 @@ class PolyFEMPanel(Panel):
                     # Button is_obstacle checkbox
                     obj_box.prop(polyfem_props, "is_obstacle", text="Is Obstacle")
 
+                    # Copy the custom properties in one pass instead of one ID-property lookup per label
+                    custom_props = dict(obj.items())
+
                     # Display the object's assigned material and material ID
-                    material_id = obj.get("material_id", "No Material")
+                    material_id = custom_props.get("material_id", "No Material")
                     obj_box.label(text=f"Material ID: {material_id}", icon='MATERIAL')
 
                     # Show material properties if they exist
-                    if "material_type" in obj.keys():
-                        obj_box.label(text=f"Material Type: {obj['material_type']}")
-                        obj_box.label(text=f"Young's Modulus (E): {obj['material_E']}")
-                        obj_box.label(text=f"Poisson's Ratio (nu): {obj['material_nu']}")
-                        obj_box.label(text=f"Density (rho): {obj['material_rho']}")
+                    if "material_type" in custom_props:
+                        obj_box.label(text=f"Material Type: {custom_props['material_type']}")
+                        obj_box.label(text=f"Young's Modulus (E): {custom_props['material_E']}")
+                        obj_box.label(text=f"Poisson's Ratio (nu): {custom_props['material_nu']}")
+                        obj_box.label(text=f"Density (rho): {custom_props['material_rho']}")
                     else:
                         obj_box.label(text="No Material Applied", icon='ERROR')
 
@@ -1,4 +1,5 @@
 import bpy
+import re
 from bpy.props import (
     StringProperty,
     BoolProperty,
@@ -47,6 +48,16 @@ material_items = [
     ("Silicone_Gel", "Silicone Gel", "Density: 1000.0 , Young's Modulus: 0.0002e9, Poisson: 0.48"),
 ]
 
+def parse_material_description(description):
+    """Extract (density, Young's modulus, Poisson's ratio) from a material item description."""
+    density_match = re.search(r"Density:\s*([\d\.eE+-]+)", description)
+    youngs_match = re.search(r"Young's Modulus:\s*([\d\.eE+-]+)", description)
+    poisson_match = re.search(r"Poisson:\s*([\d\.eE+-]+)", description)
+    return float(density_match.group(1)), float(youngs_match.group(1)), float(poisson_match.group(1))
+
+# Material properties parsed once from the dropdown descriptions
+material_properties = {identifier: parse_material_description(description) for identifier, _, description in material_items}
+
 # Define properties for the addon with high precision
 class PolyFEMSettings(PropertyGroup):
     export_path: StringProperty(
@@ -212,61 +223,9 @@ class PolyFEMSettings(PropertyGroup):
 
     def update_material_properties(self):
         """Update the material properties based on the selected material."""
-        material_data = {
-            "Steel": material_items[0][2],
-            "Copper": material_items[1][2],
-            "Aluminum": material_items[2][2],
-            "Brass": material_items[3][2],
-            "Cadmium": material_items[4][2],
-            "Cast_Iron": material_items[5][2],
-            "Chromium": material_items[6][2],
-            "Glass": material_items[7][2],
-            "Nickel": material_items[8][2],
-            "Rubber": material_items[9][2],
-            "Tungsten": material_items[10][2],
-            "Zinc": material_items[11][2],
-            "Lead": material_items[12][2],
-            "Titanium": material_items[13][2],
-            "Gold": material_items[14][2],
-            "Silver": material_items[15][2],
-            "Aluminum_Bronze": material_items[16][2],
-            "Stainless_Steel_18_8": material_items[17][2],
-            "Plexiglass": material_items[18][2],
-            "Wood": material_items[19][2],
-            "Concrete": material_items[20][2],
-            "Teflon": material_items[21][2],
-            "Leather": material_items[22][2],
-            "Graphite": material_items[23][2],
-            "Magnesium": material_items[24][2],
-            "Phosphor_Bronze": material_items[25][2],
-            "Titanium_Alloy": material_items[26][2],
-            "Silicone_Rubber": material_items[27][2],
-            "Polyurethane_Foam": material_items[28][2],
-            "Hydrogel": material_items[29][2],
-            "PDMS": material_items[30][2],
-            "Neoprene_Rubber": material_items[31][2],
-            "Polyethylene": material_items[32][2],
-            "Nylon": material_items[33][2],
-            "Silicone_Gel": material_items[34][2],
-        }
-
-        material = self.selected_material
-        if material in material_data:
-            try:
-                data_str = material_data[material]
-                import re
-                density_match = re.search(r"Density:\s*([\d\.eE+-]+)", data_str)
-                youngs_match = re.search(r"Young's Modulus:\s*([\d\.eE+-]+)", data_str)
-                poisson_match = re.search(r"Poisson:\s*([\d\.eE+-]+)", data_str)
-
-                if density_match and youngs_match and poisson_match:
-                    self.materials_rho = float(density_match.group(1))
-                    self.materials_E = float(youngs_match.group(1))
-                    self.materials_nu = float(poisson_match.group(1))
-                else:
-                    self.report({'ERROR'}, f"Failed to parse material properties for '{material}'.")
-            except Exception as e:
-                self.report({'ERROR'}, f"Error updating material properties for '{material}': {e}")
+        properties = material_properties.get(self.selected_material)
+        if properties is not None:
+            self.materials_rho, self.materials_E, self.materials_nu = properties
 
     # Solver Settings
     solver_linear_solver_items = [